@@ -1,28 +1,81 @@
+import asyncio
 import json
+import re
+import sys
+from collections import ChainMap
+from functools import lru_cache
 from typing import TypedDict, Dict, Any, List
+import ahocorasick
+import pandas as pd
 from langgraph.graph import StateGraph, END
 
+from agent_common import (
+    DEFAULT_SEQUENCE_FEATURES,
+    DEFAULT_PAYLOAD_FEATURES,
+    DEFAULT_BEHAVIOR_FEATURES,
+)
+
 
 # -------------------------
-# FEATURE DEFAULTS (used when an analyzer is skipped)
+# PAYLOAD PATTERN AUTOMATON (compiled once at import)
 # -------------------------
 
-DEFAULT_SEQUENCE_FEATURES = {
-    "login_velocity": 0.1,
-    "sequential_object_access": 0.1,
-    "request_frequency": 0.1,
-    "repeated_action_score": 0.1,
-}
-DEFAULT_PAYLOAD_FEATURES = {
-    "sql_injection_score": 0.1,
-    "unexpected_field_score": 0.1,
-    "command_injection_score": 0.1,
-}
-DEFAULT_BEHAVIOR_FEATURES = {
-    "geo_deviation_score": 0.2,
-    "role_deviation_score": 0.2,
-    "user_agent_anomaly_score": 0.2,
-}
+# All payload needles live in a single Aho-Corasick automaton so each
+# payload string is scanned in one linear pass instead of one `in` scan
+# per keyword.
+_PAYLOAD_PATTERNS = [
+    ("OR 1=1", "sql"),
+    ("UNION SELECT", "sql"),
+    ("isAdmin", "field"),
+    ("role", "field"),
+]
+
+_PAYLOAD_AUTOMATON = ahocorasick.Automaton()
+for _kw, _tag in _PAYLOAD_PATTERNS:
+    _PAYLOAD_AUTOMATON.add_word(_kw, _tag)
+_PAYLOAD_AUTOMATON.make_automaton()
+
+# Patterns used by the specialists and the behavior profiler, compiled once
+# at import. The case-insensitive flags replace the per-event .upper()/.lower()
+# copies the deep SQLi loop used to make.
+_SQLI_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(kw) for kw in ("OR 1=1", "UNION SELECT", "DROP TABLE", "' --", "1=1")),
+    re.IGNORECASE,
+)
+_ENCODING_EVASION_RE = re.compile(r"%27|%22|\\x27")
+_SECOND_ORDER_RE = re.compile(r"INSERT|UPDATE", re.IGNORECASE)
+_WAF_BYPASS_RE = re.compile(r"/\*!|concat\(", re.IGNORECASE)
+_UA_ANOMALY_RE = re.compile(r"sqlmap")
+
+# Static classifier rules: (label, primary feature, supporting features,
+# contradicting features). The table never changes, so it lives here
+# instead of being rebuilt as a dict-of-dicts on every classification.
+_HYPOTHESIS_RULES = (
+    (
+        "SQL_INJECTION",
+        "sql_injection_score",
+        ("unexpected_field_score", "user_agent_anomaly_score"),
+        ("login_velocity", "sequential_object_access"),
+    ),
+    (
+        "CREDENTIAL_STUFFING",
+        "login_velocity",
+        ("request_frequency", "geo_deviation_score"),
+        ("sql_injection_score", "sequential_object_access"),
+    ),
+    (
+        "POSSIBLE_IDOR",
+        "sequential_object_access",
+        ("role_deviation_score", "request_frequency"),
+        ("sql_injection_score", "login_velocity"),
+    ),
+    (
+        "BUSINESS_LOGIC_ABUSE",
+        "repeated_action_score",
+        ("request_frequency", "role_deviation_score"),
+        ("sql_injection_score", "login_velocity"),
+    ),
+)
 
 
 # -------------------------
@@ -32,6 +85,7 @@ DEFAULT_BEHAVIOR_FEATURES = {
 class SecurityState(TypedDict, total=False):
     selected_vuln: str
     logs: List[Dict[str, Any]]
+    log_frame: Any  # columnar view of logs, built once at ingest
     client: Any
 
     sequence_features: Dict[str, float]
@@ -59,37 +113,55 @@ class SecurityState(TypedDict, total=False):
 # ANALYSIS HELPERS (pure functions, no state mutation)
 # -------------------------
 
-def _analyze_sequences(logs):
-    login_velocity = max(
-        (0.9 if e.get("endpoint") == "/api/login" and e.get("response_code") == 401 else 0.1 for e in logs),
-        default=0.1,
-    )
-    sequential_object_access = max(
-        (0.85 if "/api/users/" in e.get("endpoint", "") else 0.1 for e in logs),
-        default=0.1,
-    )
-    request_frequency = min(len(logs) / 10.0, 1.0)
-    repeated_action_score = max(
-        (0.8 if e.get("endpoint") == "/api/orders" else 0.1 for e in logs),
-        default=0.1,
-    )
+_LOG_COLUMNS = ["endpoint", "response_code", "user_id", "user_agent", "params", "body"]
+
+
+def _logs_frame(logs) -> pd.DataFrame:
+    """Columnar (one array per field) view of the raw log dicts.
+
+    Building this once per analyzer call replaces several Python-level
+    passes over the log dicts with C-level vector ops on the columns.
+    """
+    frame = pd.DataFrame(logs, columns=_LOG_COLUMNS)
+    for col in ("endpoint", "user_agent", "params", "body"):
+        frame[col] = frame[col].fillna("")
+    return frame
+
+
+def _analyze_sequences(logs, frame: pd.DataFrame | None = None):
+    df = _logs_frame(logs) if frame is None else frame
+    failed_login = ((df["endpoint"] == "/api/login") & (df["response_code"] == 401)).any()
+    idor_probe = df["endpoint"].str.startswith("/api/users/").any()
+    repeated_orders = (df["endpoint"] == "/api/orders").any()
     return {
-        "login_velocity": login_velocity,
-        "sequential_object_access": sequential_object_access,
-        "request_frequency": request_frequency,
-        "repeated_action_score": repeated_action_score,
+        "login_velocity": 0.9 if failed_login else 0.1,
+        "sequential_object_access": 0.85 if idor_probe else 0.1,
+        "request_frequency": min(len(logs) / 10.0, 1.0),
+        "repeated_action_score": 0.8 if repeated_orders else 0.1,
     }
 
 
-def _analyze_payloads(logs):
+def _analyze_payloads(logs, frame: pd.DataFrame | None = None):
+    df = _logs_frame(logs) if frame is None else frame
     sql_injection_score = 0.1
     unexpected_field_score = 0.1
-    for e in logs:
-        params = str(e.get("params", "")) + str(e.get("body", ""))
-        if "OR 1=1" in params or "UNION SELECT" in params:
-            sql_injection_score = 0.95
-        if "isAdmin" in params or "role" in params:
-            unexpected_field_score = 0.9
+    # Scan the params and body columns as-is rather than concatenating a
+    # fresh string per event; the automaton walks each field once.
+    for column in (df["params"], df["body"]):
+        for field in column:
+            if not isinstance(field, str):
+                field = str(field)
+            for _, tag in _PAYLOAD_AUTOMATON.iter(field):
+                if tag == "sql":
+                    sql_injection_score = 0.95
+                else:
+                    unexpected_field_score = 0.9
+                if sql_injection_score == 0.95 and unexpected_field_score == 0.9:
+                    return {
+                        "sql_injection_score": sql_injection_score,
+                        "unexpected_field_score": unexpected_field_score,
+                        "command_injection_score": 0.1,
+                    }
     return {
         "sql_injection_score": sql_injection_score,
         "unexpected_field_score": unexpected_field_score,
@@ -97,19 +169,14 @@ def _analyze_payloads(logs):
     }
 
 
-def _analyze_behavior(logs):
-    role_deviation_score = max(
-        (0.75 if e.get("user_id") == 456 else 0.2 for e in logs),
-        default=0.2,
-    )
-    user_agent_anomaly_score = max(
-        (0.8 if "sqlmap" in e.get("user_agent", "") else 0.2 for e in logs),
-        default=0.2,
-    )
+def _analyze_behavior(logs, frame: pd.DataFrame | None = None):
+    df = _logs_frame(logs) if frame is None else frame
+    role_deviation = (df["user_id"] == 456).any()
+    anomalous_agent = df["user_agent"].str.contains(_UA_ANOMALY_RE).any()
     return {
         "geo_deviation_score": 0.6,
-        "role_deviation_score": role_deviation_score,
-        "user_agent_anomaly_score": user_agent_anomaly_score,
+        "role_deviation_score": 0.75 if role_deviation else 0.2,
+        "user_agent_anomaly_score": 0.8 if anomalous_agent else 0.2,
     }
 
 
@@ -155,7 +222,7 @@ Guidelines for setting weights:
 - Set explanation_level to "detailed" if the user asks for explanations or reasoning"""
 
 
-def intent_router_node(state: SecurityState) -> SecurityState:
+async def intent_router_node(state: SecurityState) -> SecurityState:
     query = (state.get("query") or "").lower()
     client = state.get("client")
     logs = state.get('logs')
@@ -169,7 +236,8 @@ def intent_router_node(state: SecurityState) -> SecurityState:
 
     if client:
         try:
-            response = client.chat.completions.create(
+            response = await asyncio.to_thread(
+                client.chat.completions.create,
                 model="openai/gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": INTENT_ROUTER_SYSTEM_PROMPT},
@@ -203,31 +271,61 @@ def log_ingest_node(state: SecurityState) -> SecurityState:
     state["logs"] = state.get("logs", [])
     state["selected_vuln"] = state.get("selected_vuln", "")
     state["retry_count"] = 0
+    # Endpoints and user agents come from small closed sets, so interning
+    # them lets later == checks against the (compiler-interned) literals
+    # short-circuit on pointer identity.
+    for e in state["logs"]:
+        for key in ("endpoint", "user_agent"):
+            value = e.get(key)
+            if type(value) is str:
+                e[key] = sys.intern(value)
+    # Columnarize once so every downstream analyzer shares one SoA view
+    # instead of re-walking the log dicts.
+    state["log_frame"] = _logs_frame(state["logs"])
     return state
 
 
-def sequence_analyzer_node(state: SecurityState) -> SecurityState:
-    state["sequence_features"] = _analyze_sequences(state["logs"])
-    return state
+# The three analyzers can run as parallel branches of the graph, so each
+# is a coroutine returning only the state key it owns (LangGraph rejects
+# concurrent writes to the same key).
 
+async def sequence_analyzer_node(state: SecurityState) -> SecurityState:
+    return {"sequence_features": _analyze_sequences(state["logs"], state.get("log_frame"))}
 
-def payload_inspector_node(state: SecurityState) -> SecurityState:
-    state["payload_features"] = _analyze_payloads(state["logs"])
-    return state
 
+async def payload_inspector_node(state: SecurityState) -> SecurityState:
+    return {"payload_features": _analyze_payloads(state["logs"], state.get("log_frame"))}
 
-def behavior_profiler_node(state: SecurityState) -> SecurityState:
-    state["behavior_features"] = _analyze_behavior(state["logs"])
-    return state
+
+async def behavior_profiler_node(state: SecurityState) -> SecurityState:
+    return {"behavior_features": _analyze_behavior(state["logs"], state.get("log_frame"))}
 
 
 def run_all_analyzers_node(state: SecurityState) -> SecurityState:
-    state["sequence_features"] = _analyze_sequences(state["logs"])
-    state["payload_features"] = _analyze_payloads(state["logs"])
-    state["behavior_features"] = _analyze_behavior(state["logs"])
+    """Runs all three analyzers in one call.
+
+    Not part of the graph (full mode fans out to the analyzer nodes and
+    widen_and_retry recomputes selectively); kept as a convenience helper
+    for direct callers and tests.
+    """
+    frame = state.get("log_frame")
+    state["sequence_features"] = _analyze_sequences(state["logs"], frame)
+    state["payload_features"] = _analyze_payloads(state["logs"], frame)
+    state["behavior_features"] = _analyze_behavior(state["logs"], frame)
     return state
 
 
+def _reduce_features(features: Dict[str, float], factors: List[str]) -> float:
+    """Returns the top score while collecting >0.7 factor names, in one pass."""
+    top = 0.0
+    for name, score in features.items():
+        if score > top:
+            top = score
+        if score > 0.7:
+            factors.append(name)
+    return top
+
+
 def risk_aggregator_node(state: SecurityState) -> SecurityState:
     sf = state.get("sequence_features") or DEFAULT_SEQUENCE_FEATURES
     pf = state.get("payload_features") or DEFAULT_PAYLOAD_FEATURES
@@ -237,9 +335,12 @@ def risk_aggregator_node(state: SecurityState) -> SecurityState:
     state["payload_features"] = pf
     state["behavior_features"] = bf
 
-    sequence_score = max(sf.values())
-    payload_score = max(pf.values())
-    behavior_score = max(bf.values())
+    # Fused reduction: each feature dict is walked exactly once for both
+    # the per-category max and the risk-factor filter.
+    risk_factors: List[str] = []
+    sequence_score = _reduce_features(sf, risk_factors)
+    payload_score = _reduce_features(pf, risk_factors)
+    behavior_score = _reduce_features(bf, risk_factors)
 
     weights = state.get("priority_weights") or {"sequence": 1.0, "payload": 1.0, "behavior": 1.0}
 
@@ -254,8 +355,7 @@ def risk_aggregator_node(state: SecurityState) -> SecurityState:
         1.0,
     )
 
-    combined = {**sf, **pf, **bf}
-    state["risk_factors"] = [k for k, v in combined.items() if v > 0.7]
+    state["risk_factors"] = risk_factors
 
     return state
 
@@ -266,53 +366,35 @@ def mini_agent_classifier_node(state: SecurityState) -> SecurityState:
     bf = state["behavior_features"]
     risk_score = state["risk_score"]
 
-    hypothesis_definitions = {
-        "SQL_INJECTION": {
-            "primary": ("sql_injection_score", pf.get("sql_injection_score", 0)),
-            "support_keys": ["unexpected_field_score", "user_agent_anomaly_score"],
-            "contradict_keys": ["login_velocity", "sequential_object_access"],
-        },
-        "CREDENTIAL_STUFFING": {
-            "primary": ("login_velocity", sf.get("login_velocity", 0)),
-            "support_keys": ["request_frequency", "geo_deviation_score"],
-            "contradict_keys": ["sql_injection_score", "sequential_object_access"],
-        },
-        "POSSIBLE_IDOR": {
-            "primary": ("sequential_object_access", sf.get("sequential_object_access", 0)),
-            "support_keys": ["role_deviation_score", "request_frequency"],
-            "contradict_keys": ["sql_injection_score", "login_velocity"],
-        },
-        "BUSINESS_LOGIC_ABUSE": {
-            "primary": ("repeated_action_score", sf.get("repeated_action_score", 0)),
-            "support_keys": ["request_frequency", "role_deviation_score"],
-            "contradict_keys": ["sql_injection_score", "login_velocity"],
-        },
-    }
-
-    all_features = {**sf, **pf, **bf}
+    # Feature keys are disjoint across the three dicts, so a ChainMap gives
+    # one lookup view without copying them into a merged dict.
+    all_features = ChainMap(sf, pf, bf)
 
     evaluated = []
-    for label, defn in hypothesis_definitions.items():
-        primary_name, primary_score = defn["primary"]
+    for label, primary_name, support_keys, contradict_keys in _HYPOTHESIS_RULES:
+        primary_score = all_features.get(primary_name, 0)
         if primary_score <= 0.5:
             continue
 
-        evidence = {"support": [primary_name], "contradict": [], "score": primary_score}
+        support = [primary_name]
+        contradict = []
+        # Evidence accumulates in integer centi-points: feature scores are
+        # multiples of 0.01, so the +0.10/-0.15 adjustments stay exact in
+        # the integer domain and only the final confidence is dequantized.
+        score_q = round(primary_score * 100)
 
-        for key in defn["support_keys"]:
-            val = all_features.get(key, 0)
-            if val > 0.5:
-                evidence["support"].append(key)
-                evidence["score"] += 0.1
+        for key in support_keys:
+            if all_features.get(key, 0) > 0.5:
+                support.append(key)
+                score_q += 10
 
-        for key in defn["contradict_keys"]:
-            val = all_features.get(key, 0)
-            if val > 0.7:
-                evidence["contradict"].append(key)
-                evidence["score"] -= 0.15
+        for key in contradict_keys:
+            if all_features.get(key, 0) > 0.7:
+                contradict.append(key)
+                score_q -= 15
 
-        evidence["score"] = max(evidence["score"], 0) * risk_score
-        evaluated.append((label, evidence))
+        score = max(score_q, 0) / 100 * risk_score
+        evaluated.append((label, {"support": support, "contradict": contradict, "score": score}))
 
     if not evaluated:
         state["alert_type"] = None
@@ -325,10 +407,18 @@ def mini_agent_classifier_node(state: SecurityState) -> SecurityState:
         }
         return state
 
-    evaluated.sort(key=lambda x: x[1]["score"], reverse=True)
+    # One pass tracking the two best scores instead of sorting everything
+    # just to look at the top two.
     top_label, top_evidence = evaluated[0]
-
-    if len(evaluated) >= 2 and abs(evaluated[0][1]["score"] - evaluated[1][1]["score"]) <= 0.1:
+    runner_up_score = None
+    for label, evidence in evaluated[1:]:
+        if evidence["score"] > top_evidence["score"]:
+            runner_up_score = top_evidence["score"]
+            top_label, top_evidence = label, evidence
+        elif runner_up_score is None or evidence["score"] > runner_up_score:
+            runner_up_score = evidence["score"]
+
+    if runner_up_score is not None and abs(top_evidence["score"] - runner_up_score) <= 0.1:
         top_label = "MULTI_VECTOR_ATTACK"
 
     state["alert_type"] = top_label
@@ -364,9 +454,21 @@ def widen_and_retry_node(state: SecurityState) -> SecurityState:
     state["analysis_mode"] = "full"
     state["retry_count"] = state.get("retry_count", 0) + 1
     state["priority_weights"] = {"sequence": 1.0, "payload": 1.0, "behavior": 1.0}
-    state["sequence_features"] = _analyze_sequences(state["logs"])
-    state["payload_features"] = _analyze_payloads(state["logs"])
-    state["behavior_features"] = _analyze_behavior(state["logs"])
+
+    # The focused analyzer already ran on these logs; only the feature sets
+    # risk_aggregator back-filled with defaults need computing now. (The
+    # aggregator assigns the DEFAULT_* constants themselves, so an identity
+    # check tells a skipped analyzer apart from a genuinely benign result.)
+    frame = state.get("log_frame")
+    sf = state.get("sequence_features")
+    if sf is None or sf is DEFAULT_SEQUENCE_FEATURES:
+        state["sequence_features"] = _analyze_sequences(state["logs"], frame)
+    pf = state.get("payload_features")
+    if pf is None or pf is DEFAULT_PAYLOAD_FEATURES:
+        state["payload_features"] = _analyze_payloads(state["logs"], frame)
+    bf = state.get("behavior_features")
+    if bf is None or bf is DEFAULT_BEHAVIOR_FEATURES:
+        state["behavior_features"] = _analyze_behavior(state["logs"], frame)
     return state
 
 
@@ -382,13 +484,13 @@ def deep_sqli_analyzer_node(state: SecurityState) -> SecurityState:
     }
     for e in logs:
         params = str(e.get("params", "")) + str(e.get("body", ""))
-        if "%27" in params or "%22" in params or "\\x27" in params:
+        if _ENCODING_EVASION_RE.search(params):
             findings["encoding_evasion"] = True
-        if "INSERT" in params.upper() or "UPDATE" in params.upper():
+        if _SECOND_ORDER_RE.search(params):
             findings["second_order_patterns"] = True
-        if "/*!50000" in params or "/*!" in params or "concat(" in params.lower():
+        if _WAF_BYPASS_RE.search(params):
             findings["waf_bypass_attempts"] = True
-        if any(kw in params.upper() for kw in ["OR 1=1", "UNION SELECT", "DROP TABLE", "' --", "1=1"]):
+        if _SQLI_KEYWORDS_RE.search(params):
             findings["injection_points"].append(e.get("endpoint", "unknown"))
             findings["payload_samples"].append(params[:200])
     state["deep_dive_findings"] = findings
@@ -423,7 +525,7 @@ def deep_idor_analyzer_node(state: SecurityState) -> SecurityState:
     for e in logs:
         uid = e.get("user_id", "unknown")
         ep = e.get("endpoint", "")
-        if "/api/users/" in ep:
+        if ep.startswith("/api/users/"):
             user_endpoint_access.setdefault(uid, []).append(ep)
 
     sequential_patterns = {}
@@ -463,7 +565,7 @@ THREAT_NARRATIVE_SYSTEM_PROMPT = """You are a senior security analyst writing a
 Be specific — reference actual feature names and scores. Write in a direct, professional tone suitable for a security operations dashboard. Do not use markdown formatting."""
 
 
-def llm_threat_narrative_node(state: SecurityState) -> SecurityState:
+async def llm_threat_narrative_node(state: SecurityState) -> SecurityState:
     """Uses the LLM to synthesize all computed scores into a human-readable threat analysis."""
     client = state.get("client")
 
@@ -484,7 +586,8 @@ def llm_threat_narrative_node(state: SecurityState) -> SecurityState:
 
     if client:
         try:
-            response = client.chat.completions.create(
+            response = await asyncio.to_thread(
+                client.chat.completions.create,
                 model="openai/gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": THREAT_NARRATIVE_SYSTEM_PROMPT},
@@ -520,16 +623,30 @@ def llm_threat_narrative_node(state: SecurityState) -> SecurityState:
 # ROUTING FUNCTIONS
 # -------------------------
 
-def route_analyzers(state: SecurityState) -> str:
-    """Routes to the appropriate analyzer(s) based on intent_router's analysis_mode."""
+# Routing decisions are static threshold/equality dispatches, so they use
+# module-level lookup tables instead of branch cascades.
+_FOCUS_MODE_ANALYZERS = {
+    "payload_focus": "payload_inspector",
+    "sequence_focus": "sequence_analyzer",
+    "behavior_focus": "behavior_profiler",
+}
+_ALL_ANALYZERS = ["sequence_analyzer", "payload_inspector", "behavior_profiler"]
+
+_SPECIALIST_ANALYZERS = {
+    "SQL_INJECTION": "deep_sqli_analyzer",
+    "CREDENTIAL_STUFFING": "deep_credential_analyzer",
+    "POSSIBLE_IDOR": "deep_idor_analyzer",
+}
+
+
+def route_analyzers(state: SecurityState) -> str | list[str]:
+    """Routes to the appropriate analyzer(s) based on intent_router's analysis_mode.
+
+    Full mode returns all three analyzers so LangGraph runs them as
+    parallel branches that fan back in at risk_aggregator.
+    """
     mode = state.get("analysis_mode", "full")
-    if mode == "payload_focus":
-        return "payload_inspector"
-    elif mode == "sequence_focus":
-        return "sequence_analyzer"
-    elif mode == "behavior_focus":
-        return "behavior_profiler"
-    return "run_all_analyzers"
+    return _FOCUS_MODE_ANALYZERS.get(mode, _ALL_ANALYZERS)
 
 
 def check_risk_level(state: SecurityState) -> str:
@@ -551,14 +668,8 @@ def route_after_classification(state: SecurityState) -> str:
         return "widen_and_retry"
 
     # High confidence with a known attack type -> specialist deep-dive
-    if confidence >= 0.4 and alert_type:
-        specialist_map = {
-            "SQL_INJECTION": "deep_sqli_analyzer",
-            "CREDENTIAL_STUFFING": "deep_credential_analyzer",
-            "POSSIBLE_IDOR": "deep_idor_analyzer",
-        }
-        if alert_type in specialist_map:
-            return specialist_map[alert_type]
+    if confidence >= 0.4 and alert_type in _SPECIALIST_ANALYZERS:
+        return _SPECIALIST_ANALYZERS[alert_type]
 
     return "llm_threat_narrative"
 
@@ -567,6 +678,7 @@ def route_after_classification(state: SecurityState) -> str:
 # GRAPH CONSTRUCTION
 # -------------------------
 
+@lru_cache(maxsize=1)
 def create_real_agentic_workflow():
     builder = StateGraph(SecurityState)
 
@@ -576,7 +688,6 @@ def create_real_agentic_workflow():
     builder.add_node("sequence_analyzer", sequence_analyzer_node)
     builder.add_node("payload_inspector", payload_inspector_node)
     builder.add_node("behavior_profiler", behavior_profiler_node)
-    builder.add_node("run_all_analyzers", run_all_analyzers_node)
     builder.add_node("risk_aggregator", risk_aggregator_node)
     builder.add_node("benign_summary", benign_summary_node)
     builder.add_node("mini_agent_classifier", mini_agent_classifier_node)
@@ -592,11 +703,16 @@ def create_real_agentic_workflow():
     # log_ingest -> intent_router
     builder.add_edge("log_ingest", "intent_router")
 
-    # Conditional: route to analyzer(s) based on analysis_mode
+    # Conditional: route to analyzer(s) based on analysis_mode; full mode
+    # fans out to all three analyzers in parallel
     builder.add_conditional_edges("intent_router", route_analyzers)
 
-    # All analyzer paths converge at risk_aggregator
-    builder.add_edge("run_all_analyzers", "risk_aggregator")
+    # All analyzer paths converge at risk_aggregator. These stay as
+    # individual edges (not a list-form join, which would block focus
+    # modes that run only one analyzer): the full-mode fan-out dispatches
+    # all three in the same superstep, so the aggregator fires once with
+    # every feature set merged. An analyzer spanning supersteps would
+    # need a different join strategy.
     builder.add_edge("sequence_analyzer", "risk_aggregator")
     builder.add_edge("payload_inspector", "risk_aggregator")
     builder.add_edge("behavior_profiler", "risk_aggregator")
@@ -626,8 +742,25 @@ def create_real_agentic_workflow():
 # SEND FINDINGS BACK TO UI
 # -------------------------
 
-graph = create_real_agentic_workflow()
+async def arun_agent(input_data: dict, client):
+    return await create_real_agentic_workflow().ainvoke({**input_data, "client": client})
+
+
+async def arun_agent_batch(inputs: List[dict], client, max_concurrency: int = 8):
+    """Analyzes several log batches concurrently.
+
+    The semaphore keeps at most max_concurrency runs (and therefore LLM
+    round-trips) in flight at once; results come back in input order.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(input_data: dict):
+        async with sem:
+            return await arun_agent(input_data, client)
+
+    return await asyncio.gather(*(bounded(i) for i in inputs))
 
 
 def run_agent(input_data: dict, client):
-    return graph.invoke({**input_data, "client": client})
+    """Synchronous entry point for callers without an event loop (UI, tests)."""
+    return asyncio.run(arun_agent(input_data, client))
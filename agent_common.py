@@ -0,0 +1,23 @@
+# Constants shared by the agent workflow variants (agent.py, agent_fix.py)
+# so importing several variants in one process keeps a single copy.
+
+# -------------------------
+# FEATURE DEFAULTS (used when an analyzer is skipped)
+# -------------------------
+
+DEFAULT_SEQUENCE_FEATURES = {
+    "login_velocity": 0.1,
+    "sequential_object_access": 0.1,
+    "request_frequency": 0.1,
+    "repeated_action_score": 0.1,
+}
+DEFAULT_PAYLOAD_FEATURES = {
+    "sql_injection_score": 0.1,
+    "unexpected_field_score": 0.1,
+    "command_injection_score": 0.1,
+}
+DEFAULT_BEHAVIOR_FEATURES = {
+    "geo_deviation_score": 0.2,
+    "role_deviation_score": 0.2,
+    "user_agent_anomaly_score": 0.2,
+}
@@ -7,6 +7,12 @@ from enum import Enum
 from functools import lru_cache
 from langgraph.graph import StateGraph, END
 
+from agent_common import (
+    DEFAULT_SEQUENCE_FEATURES,
+    DEFAULT_PAYLOAD_FEATURES,
+    DEFAULT_BEHAVIOR_FEATURES,
+)
+
 # -------------------------
 # LOGGING CONFIGURATION
 # -------------------------
@@ -29,28 +35,6 @@ MAX_RETRY_COUNT = 2
 CACHE_SIZE = 100
 
 
-# -------------------------
-# FEATURE DEFAULTS (used when an analyzer is skipped)
-# -------------------------
-
-DEFAULT_SEQUENCE_FEATURES = {
-    "login_velocity": 0.1,
-    "sequential_object_access": 0.1,
-    "request_frequency": 0.1,
-    "repeated_action_score": 0.1,
-}
-DEFAULT_PAYLOAD_FEATURES = {
-    "sql_injection_score": 0.1,
-    "unexpected_field_score": 0.1,
-    "command_injection_score": 0.1,
-}
-DEFAULT_BEHAVIOR_FEATURES = {
-    "geo_deviation_score": 0.2,
-    "role_deviation_score": 0.2,
-    "user_agent_anomaly_score": 0.2,
-}
-
-
 # -------------------------
 # ENUMS FOR TYPE SAFETY
 # -------------------------
@@ -1320,12 +1304,13 @@ def route_after_classification(state: SecurityState) -> str:
 # GRAPH CONSTRUCTION
 # -------------------------
 
+@lru_cache(maxsize=1)
 def create_real_agentic_workflow():
     """
     Creates and compiles the LangGraph workflow for security analysis.
-    
+
     Returns:
-        Compiled StateGraph
+        Compiled StateGraph (built once per process)
     """
     logger.info("Building security analysis workflow graph")
     
@@ -1388,10 +1373,6 @@ def create_real_agentic_workflow():
 # MAIN EXECUTION INTERFACE
 # -------------------------
 
-# Create the compiled graph
-graph = create_real_agentic_workflow()
-
-
 def run_agent(input_data: dict, client) -> dict:
     """
     Main entry point for running the security analysis agent.
@@ -1406,7 +1387,7 @@ def run_agent(input_data: dict, client) -> dict:
     logger.info("Starting agent execution")
     
     try:
-        result = graph.invoke({**input_data, "client": client})
+        result = create_real_agentic_workflow().invoke({**input_data, "client": client})
         logger.info("Agent execution completed successfully")
         return result
     except Exception as e:
@@ -1,3 +1,4 @@
+import json
 import requests
 import os
 import openai
@@ -7,8 +8,10 @@ import pandas as pd
 import plotly.graph_objects as go
 from agent import run_agent
 
-response = requests.get("http://localhost:8000/logs")
-logs = response.json()
+# The server streams NDJSON: one vulnerability entry per line, so entries
+# can be parsed as they arrive instead of buffering the whole body.
+response = requests.get("http://localhost:8000/logs", stream=True)
+logs = [json.loads(line) for line in response.iter_lines() if line]
 
 for log in logs:
     print(log)
@@ -6,6 +6,7 @@ from dotenv import load_dotenv
 import pandas as pd
 import plotly.graph_objects as go
 from agent import run_agent
+import json
 import re
 import logging
 from typing import Dict, Any, List, Optional
@@ -49,11 +50,13 @@ def fetch_logs() -> List[Dict[str, Any]]:
         response = requests.get(
             LOG_API_URL,
             timeout=5,
-            headers=headers
+            headers=headers,
+            stream=True
         )
         response.raise_for_status()
-        logs = response.json()
-        
+        # The server streams NDJSON: one vulnerability entry per line
+        logs = [json.loads(line) for line in response.iter_lines() if line]
+
         logger.info(f"Successfully fetched {len(logs)} log entries")
         return logs
         
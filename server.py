@@ -1,15 +1,18 @@
+import orjson
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 
 app = FastAPI()
 
-import json
 
+with open("mock_logs.json", "rb") as f:
+    MOCK_LOGS = orjson.loads(f.read())
 
-with open("mock_logs.json") as MOCK_LOGS:
-    MOCK_LOGS = json.load(MOCK_LOGS)
+# One pre-encoded NDJSON line per vulnerability entry; /logs streams these
+# instead of buffering one giant JSON body per request.
+_MOCK_LOG_LINES = [orjson.dumps(entry) + b"\n" for entry in MOCK_LOGS]
 
 
 @app.get("/logs")
 def get_logs():
-    print ("got log request")
-    return MOCK_LOGS
+    return StreamingResponse(iter(_MOCK_LOG_LINES), media_type="application/x-ndjson")
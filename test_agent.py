@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from agent import (
     # Helpers
@@ -30,6 +32,7 @@ from agent import (
     DEFAULT_BEHAVIOR_FEATURES,
     # End-to-end
     run_agent,
+    arun_agent_batch,
 )
 
 
@@ -151,12 +154,15 @@ class TestAnalyzeBehavior:
 # 2. ROUTING FUNCTION TESTS
 # =========================================================
 
+ALL_ANALYZERS = ["sequence_analyzer", "payload_inspector", "behavior_profiler"]
+
+
 class TestRouteAnalyzers:
-    def test_full_mode(self):
-        assert route_analyzers({"analysis_mode": "full"}) == "run_all_analyzers"
+    def test_full_mode_fans_out_to_all_analyzers(self):
+        assert route_analyzers({"analysis_mode": "full"}) == ALL_ANALYZERS
 
-    def test_default_mode(self):
-        assert route_analyzers({}) == "run_all_analyzers"
+    def test_default_mode_fans_out_to_all_analyzers(self):
+        assert route_analyzers({}) == ALL_ANALYZERS
 
     def test_payload_focus(self):
         assert route_analyzers({"analysis_mode": "payload_focus"}) == "payload_inspector"
@@ -281,29 +287,29 @@ class TestLogIngestNode:
 class TestIntentRouterNode:
     def test_empty_query_defaults_to_full(self):
         state = {"query": "", "client": None}
-        result = intent_router_node(state)
+        result = asyncio.run(intent_router_node(state))
         assert result["analysis_mode"] == "full"
         assert result["priority_weights"] == {"sequence": 1.0, "payload": 1.0, "behavior": 1.0}
 
     def test_keyword_fallback_sql(self):
         state = {"query": "detect sql injection", "client": None}
-        result = intent_router_node(state)
+        result = asyncio.run(intent_router_node(state))
         assert result["analysis_mode"] == "payload_focus"
         assert result["priority_weights"]["payload"] == 1.5
 
     def test_keyword_fallback_credential(self):
         state = {"query": "find credential stuffing", "client": None}
-        result = intent_router_node(state)
+        result = asyncio.run(intent_router_node(state))
         assert result["analysis_mode"] == "sequence_focus"
 
     def test_keyword_fallback_login(self):
         state = {"query": "show failed login attempts", "client": None}
-        result = intent_router_node(state)
+        result = asyncio.run(intent_router_node(state))
         assert result["analysis_mode"] == "sequence_focus"
 
     def test_keyword_fallback_behavior(self):
         state = {"query": "check for unusual behavior", "client": None}
-        result = intent_router_node(state)
+        result = asyncio.run(intent_router_node(state))
         assert result["analysis_mode"] == "behavior_focus"
 
 
@@ -454,7 +460,7 @@ class TestLlmThreatNarrativeNode:
             "risk_factors": ["sql_injection_score"],
             "logs": [],
         }
-        result = llm_threat_narrative_node(state)
+        result = asyncio.run(llm_threat_narrative_node(state))
         assert "SQL_INJECTION" in result["threat_narrative"]
         assert "80%" in result["threat_narrative"]
 
@@ -468,7 +474,7 @@ class TestLlmThreatNarrativeNode:
             "deep_dive_findings": {"attack_type": "SQL_INJECTION"},
             "logs": [],
         }
-        result = llm_threat_narrative_node(state)
+        result = asyncio.run(llm_threat_narrative_node(state))
         assert "Deep-dive" in result["threat_narrative"]
 
 
@@ -562,6 +568,18 @@ class TestEndToEndPipeline:
             assert key in result, f"Missing expected key: {key}"
 
 
+class TestBatchExecution:
+    def test_batch_matches_single_runs(self):
+        inputs = [
+            {"logs": SQL_INJECTION_LOGS, "query": "", "selected_vuln": "SQLi"},
+            {"logs": BENIGN_LOGS, "query": "", "selected_vuln": ""},
+        ]
+        results = asyncio.run(arun_agent_batch(inputs, client=None, max_concurrency=2))
+        assert len(results) == 2
+        assert results[0]["alert_type"] is not None
+        assert results[1]["alert_type"] is None
+
+
 class TestKeywordFallback:
     def test_sql_keyword(self):
         result = _keyword_fallback("check for sql issues")
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch, MagicMock
 import pytest
 from streamlit.testing.v1 import AppTest
@@ -28,12 +29,18 @@ MOCK_AGENT_RESULT = {
 }
 
 
-def _build_app():
-    """Launch main.py under AppTest with the /logs request mocked."""
+def _mock_log_response():
+    """Mock /logs response streaming one NDJSON line per entry."""
     mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_LOGS
+    mock_response.iter_lines.return_value = [
+        json.dumps(entry).encode() for entry in MOCK_LOGS
+    ]
+    return mock_response
 
-    with patch("requests.get", return_value=mock_response):
+
+def _build_app():
+    """Launch main.py under AppTest with the /logs request mocked."""
+    with patch("requests.get", return_value=_mock_log_response()):
         return AppTest.from_file("main.py").run(timeout=30)
 
 
@@ -69,8 +76,7 @@ def test_preset_option_passed_to_agent():
     # Mock run_agent and the openrouter_client in session state
     at.session_state["openrouter_client"] = MagicMock()
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_LOGS
+    mock_response = _mock_log_response()
 
     with patch("requests.get", return_value=mock_response), \
          patch("main.run_agent", return_value=MOCK_AGENT_RESULT) as mock_agent:
@@ -98,8 +104,7 @@ def test_custom_option_shows_text_input():
     sb = user_query_boxes[0]
     sb.set_value("Custom...")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_LOGS
+    mock_response = _mock_log_response()
 
     with patch("requests.get", return_value=mock_response):
         at = at.run(timeout=30)
@@ -118,8 +123,7 @@ def test_custom_query_passed_to_agent():
     sb = user_query_boxes[0]
     sb.set_value("Custom...")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_LOGS
+    mock_response = _mock_log_response()
 
     with patch("requests.get", return_value=mock_response):
         at = at.run(timeout=30)
@@ -156,8 +160,7 @@ def test_no_text_input_for_preset_option():
     sb = user_query_boxes[0]
     sb.set_value("Show failed logins")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_LOGS
+    mock_response = _mock_log_response()
 
     with patch("requests.get", return_value=mock_response):
         at = at.run(timeout=30)